@@ -17,31 +17,118 @@ Abordagem de limpeza de dados, conforme o escopo definido:
 
 from __future__ import annotations
 import sys
+import codecs
+import io
 import os
 import re
+import shutil
+import tempfile
 import unicodedata
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
-from typing import Any
+from typing import Any, BinaryIO
+
+try:  # numba é opcional: sem ele a limpeza usa apenas o pandas
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:  # pyarrow é opcional: com ele as colunas de texto usam strings Arrow
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pc = pacsv = None
+
+try:  # xlsxwriter é opcional: grava .xlsx em modo de memória constante
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+try:  # polars é opcional: habilita o backend lazy/streaming para CSV
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Tamanho de bloco sugerido para CSVs que não cabem na memória (LIMPEZA_CHUNKSIZE)
+TAMANHO_BLOCO_PADRAO = 200_000
+
+# Padrões de expressão regular compilados uma única vez na importação
+_RE_MOJIBAKE = re.compile(r'[ÃÂ ]')                   # indícios de mojibake
+_RE_NAO_ASCII = re.compile(r'[^\x00-\x7F]')            # caracteres fora do ASCII
+_RE_DEC_COMMA = re.compile(r'(\d),(\d)')               # vírgula decimal
+_RE_PRECO_CHARS = re.compile(r'[^0-9\.\-]+')           # inválidos em preços
+_RE_SIZE_FULL = re.compile(r'.*_\d+[xX]\d+')           # padrão tamanho com underscore
+_RE_NON_ALNUM_US_X = re.compile(r'[^A-Za-z0-9_xX ]+')  # inválidos, mantém underscore e 'x'
+_RE_NON_ALNUM = re.compile(r'[^A-Za-z0-9 ]+')          # inválidos
+_RE_NON_ALNUM_US = re.compile(r'[^A-Za-z0-9_ ]+')      # inválidos, mantém underscore
+_RE_MULTI_SPACE = re.compile(r'\s+')                   # espaços repetidos
+_RE_CAMEL = re.compile(r'([a-z])([A-Z])')              # camelCase
+_RE_LET_DIG = re.compile(r'([A-Za-z])(\d)')            # letra+número
+_RE_DIG_LET = re.compile(r'(\d)([A-Za-z])')            # número+letra
+_RE_X_PATTERN = re.compile(r'(\d)\s*[xX]\s*(\d)')      # padrão "x" entre números
+_RE_US_TRIM = re.compile(r'\s*_\s*')                   # espaços ao redor de underscore
+_RE_NUMERIC_STR = re.compile(r'^-?\d+(\.\d+)?$')       # número em formato texto
+_PADRAO_MARCAS = r'\p{Mn}'                              # marcas combinantes (sintaxe RE2/Rust)
+
+# Textos que o read_csv do pandas lê como nulos (na_values padrão)
+_VALORES_NULOS_PANDAS = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+                         '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null']
+
+# Limites de uma planilha .xlsx
+_MAX_LINHAS_XLSX = 1_048_576
+_MAX_COLUNAS_XLSX = 16_384
+
+
+class _TabelaMarcas(dict):
+    """Tabela para `str.translate` que descarta marcas combinantes (categoria 'Mn')."""
+
+    def __missing__(self, codigo: int) -> int | None:
+        # Cada caractere é classificado uma única vez e fica em cache na própria tabela
+        valor = None if unicodedata.category(chr(codigo)) == 'Mn' else codigo
+        self[codigo] = valor
+        return valor
+
+
+_TABELA_MARCAS = _TabelaMarcas()
 
 
 def corrigir_mojibake(texto: Any) -> Any:
     """Corrige problemas de encoding (mojibake) em textos importados."""
     if not isinstance(texto, str):
         return texto
-    if re.search(r'[ÃÂ ]', texto):
-        try:
-            return texto.encode('latin1').decode('utf-8')
-        except Exception:
-            return texto
-    return texto
+    # Caminho rápido: texto ASCII não muda no round-trip latin1 -> utf-8, e os testes
+    # de substring (memchr em C) evitam o custo do regex no caso comum
+    if texto.isascii() or ('Ã' not in texto and 'Â' not in texto and ' ' not in texto):
+        return texto
+    try:
+        return texto.encode('latin1').decode('utf-8')
+    except Exception:
+        return texto
 
 
 def remover_acentos(texto: Any) -> Any:
-    """Remove acentuação e normaliza caracteres especiais em textos."""
+    """
+    Remove acentuação e normaliza caracteres especiais em textos.
+    Para letras acentuadas (áéíóúâêôãõàüç...) o resultado é o mesmo da filtragem por
+    categoria 'Mn'; diferente dela, símbolos sem equivalente ASCII (ex.: ß, Ø, ©) também
+    são descartados. A limpeza dos valores usa `_remover_marcas`, que os mantém.
+    """
     if not isinstance(texto, str):
         return texto
-    texto = unicodedata.normalize('NFKD', texto)
-    return ''.join(ch for ch in texto if unicodedata.category(ch) != 'Mn')
+    # Após NFKD os acentos viram marcas combinantes não-ASCII, descartadas no encode
+    return unicodedata.normalize('NFKD', texto).encode('ascii', 'ignore').decode('ascii')
+
+
+def _remover_marcas(texto: str) -> str:
+    """
+    Remove apenas a acentuação (marcas 'Mn' após NFKD), mantendo outros símbolos não-ASCII.
+    Na limpeza, símbolos como ®, ß e Ø só são descartados depois das regras de vírgula
+    decimal e de padrão de tamanho, como na versão original.
+    """
+    return unicodedata.normalize('NFKD', texto).translate(_TABELA_MARCAS)
 
 
 def limpar_texto(valor: Any, contexto: str = "geral", nome_coluna: str | None = None) -> Any:
@@ -50,43 +137,214 @@ def limpar_texto(valor: Any, contexto: str = "geral", nome_coluna: str | None =
     - Remove caracteres inválidos.
     - Normaliza espaços.
     - Aplica regras específicas para 'produtos' ou 'clientes'.
+    Versão escalar de referência: o processamento usa as versões vetorizadas
+    (`_limpar_preco`, `_limpar_produtos` e `_limpar_clientes`), que decidem as regras
+    uma vez por coluna.
     """
     if pd.isna(valor): # mantém NaN
         return valor # mantém NaN
+    eh_produtos = contexto == "produtos"
+    eh_preco = eh_produtos and bool(nome_coluna) and nome_coluna.lower() == "preco"
     texto = str(valor) # garante que é string
     texto = corrigir_mojibake(texto) # corrige mojibake
-    texto = remover_acentos(texto) # remove acentuação
-    texto = re.sub(r'(\d),(\d)', r'\1.\2', texto)  # troca vírgula decimal por ponto
+    texto = _remover_marcas(texto) # remove acentuação
+    texto = _RE_DEC_COMMA.sub(r'\1.\2', texto)  # troca vírgula decimal por ponto
 
-    if contexto == "produtos":
+    if eh_produtos:
         # Regras específicas para produtos
-        if nome_coluna and nome_coluna.lower() == "preco":   # coluna de preço
-            texto = re.sub(r'[^0-9\.\-]+', '', texto)        # remove inválidos, mantém ponto e hífen
+        if eh_preco:                                         # coluna de preço
+            texto = _RE_PRECO_CHARS.sub('', texto)           # remove inválidos, mantém ponto e hífen
             return texto.strip()                             # remove espaços extras
-        if re.fullmatch(r'.*_\d+[xX]\d+', texto):            # padrão tamanho com underscore
-            texto = re.sub(r'[^A-Za-z0-9_xX ]+', '', texto)  # remove inválidos, mantém underscore e 'x'
-            texto = re.sub(r'\s+', ' ', texto).strip()       # remove espaços extras
-            texto = re.sub(r'(\d)\s*[xX]\s*(\d)', r'\1x\2', texto)  # normaliza padrão "x"
+        if _RE_SIZE_FULL.fullmatch(texto):                   # padrão tamanho com underscore
+            texto = _RE_NON_ALNUM_US_X.sub('', texto)        # remove inválidos, mantém underscore e 'x'
+            texto = _RE_MULTI_SPACE.sub(' ', texto).strip()  # remove espaços extras
+            texto = _RE_X_PATTERN.sub(r'\1x\2', texto)       # normaliza padrão "x"
             return texto 
         texto = texto.replace("_", " ")                    # trata underscore como espaço
-        texto = re.sub(r'[^A-Za-z0-9 ]+', '', texto)       # remove inválidos
-        texto = re.sub(r'\s+', ' ', texto).strip()         # remove espaços extras
-        texto = re.sub(r'([a-z])([A-Z])', r'\1 \2', texto)  # separa camelCase
-        texto = re.sub(r'([A-Za-z])(\d)', r'\1 \2', texto)  # separa letra+número
-        texto = re.sub(r'(\d)([A-Za-z])', r'\1 \2', texto)  # separa número+letra
-        texto = re.sub(r'(\d)\s*[xX]\s*(\d)', r'\1x\2', texto)  # normaliza padrão "x"
+        texto = _RE_NON_ALNUM.sub('', texto)       # remove inválidos
+        texto = _RE_MULTI_SPACE.sub(' ', texto).strip()         # remove espaços extras
+        texto = _RE_CAMEL.sub(r'\1 \2', texto)  # separa camelCase
+        texto = _RE_LET_DIG.sub(r'\1 \2', texto)  # separa letra+número
+        texto = _RE_DIG_LET.sub(r'\1 \2', texto)  # separa número+letra
+        texto = _RE_X_PATTERN.sub(r'\1x\2', texto)  # normaliza padrão "x"
         return texto.strip()
     else:
         # Regras específicas para clientes
-        texto = re.sub(r'\s*_\s*', '_', texto)       # mantém underscore limpo
-        texto = re.sub(r'[^A-Za-z0-9_ ]+', '', texto)  # remove inválidos
-        texto = re.sub(r'\s+', ' ', texto).strip()   # remove espaços extras
-        texto = re.sub(r'([A-Za-z])(\d)', r'\1 \2', texto)  # separa letra+número
-        texto = re.sub(r'(\d)([A-Za-z])', r'\1 \2', texto)  # separa número+letra
-        texto = re.sub(r'\s*_\s*', '_', texto)     # limpa espaços em underscores
+        texto = _RE_US_TRIM.sub('_', texto)       # mantém underscore limpo
+        texto = _RE_NON_ALNUM_US.sub('', texto)  # remove inválidos
+        texto = _RE_MULTI_SPACE.sub(' ', texto).strip()   # remove espaços extras
+        texto = _RE_LET_DIG.sub(r'\1 \2', texto)  # separa letra+número
+        texto = _RE_DIG_LET.sub(r'\1 \2', texto)  # separa número+letra
+        texto = _RE_US_TRIM.sub('_', texto)     # limpa espaços em underscores
         return texto.strip()
 
 
+def _limpar_cabecalho(nome: Any) -> Any:
+    """
+    Limpa um nome de coluna: corrige mojibake, remove acentuação e caracteres inválidos
+    e normaliza espaços. Não separa camelCase nem letras/números, como faz `limpar_texto`.
+    """
+    if pd.isna(nome):
+        return nome
+    texto = remover_acentos(corrigir_mojibake(str(nome)))
+    texto = _RE_NON_ALNUM_US.sub('', texto)              # mantém letras, números, underscore e espaço
+    return _RE_MULTI_SPACE.sub(' ', texto).strip()       # remove espaços extras
+
+
+def _preparar_serie(serie: pd.Series) -> pd.Series:
+    """
+    Etapas comuns da limpeza vetorizada de uma coluna:
+    - Converte valores não nulos para string (mantém NaN).
+    - Corrige mojibake apenas nas linhas suspeitas.
+    - Remove acentuação e troca vírgula decimal por ponto.
+    """
+    # Só converte quando há valores que não são texto (StringDtype mantém os nulos como NA)
+    texto = serie if pd.api.types.is_string_dtype(serie) else serie.astype('string')
+    if pa is not None:
+        texto = texto.astype(pd.ArrowDtype(pa.string()))  # buffers UTF-8 contíguos e kernels em C++
+    # Só textos com caracteres não-ASCII podem mudar ao corrigir o encoding
+    suspeitos = (texto.str.contains(_RE_MOJIBAKE.pattern, na=False)
+                 & texto.str.contains(_RE_NAO_ASCII.pattern, na=False))
+    if suspeitos.any():
+        texto[suspeitos] = texto[suspeitos].map(corrigir_mojibake)
+    texto = texto.str.normalize('NFKD')
+    if pa is not None:
+        texto = texto.str.replace(_PADRAO_MARCAS, '', regex=True)  # remove acentuação
+    else:
+        texto = texto.str.translate(_TABELA_MARCAS)  # o `re` do Python não tem \p{Mn}
+    return texto.str.replace(_RE_DEC_COMMA.pattern, r'\1.\2', regex=True)  # troca vírgula decimal por ponto
+
+
+def _limpar_preco(serie: pd.Series) -> pd.Series:
+    """
+    Versão vetorizada de `limpar_texto` para a coluna de preço de 'produtos'.
+    Os padrões são passados como texto (`.pattern`), pois o backend Arrow não aceita `re.Pattern`.
+    """
+    texto = _preparar_serie(serie)
+    return texto.str.replace(_RE_PRECO_CHARS.pattern, '', regex=True).str.strip()  # mantém ponto e hífen
+
+
+def _limpar_produtos(serie: pd.Series) -> pd.Series:
+    """Versão vetorizada de `limpar_texto` para as demais colunas de 'produtos'."""
+    texto = _preparar_serie(serie)
+    tamanho = texto.str.fullmatch(_RE_SIZE_FULL.pattern, na=False)  # padrão tamanho com underscore
+    if tamanho.any():
+        t = texto[tamanho]
+        t = t.str.replace(_RE_NON_ALNUM_US_X.pattern, '', regex=True)  # remove inválidos, mantém underscore e 'x'
+        t = t.str.replace(_RE_MULTI_SPACE.pattern, ' ', regex=True).str.strip()   # remove espaços extras
+        texto[tamanho] = t.str.replace(_RE_X_PATTERN.pattern, r'\1x\2', regex=True)  # normaliza padrão "x"
+    geral = ~tamanho
+    if geral.any():
+        texto[geral] = _limpar_produtos_geral(texto[geral])
+    return texto
+
+
+def _limpar_produtos_geral(g: pd.Series) -> pd.Series:
+    """Regras gerais de 'produtos' sobre textos já sem acentuação."""
+    if _limpar_ascii_produtos is not None and pa is not None:
+        # Kernel compilado: uma única chamada sobre os buffers UTF-8 e de offsets da coluna
+        # inteira, sem a cadeia de regex e sem o GIL (as demais colunas seguem em paralelo)
+        textos = pa.array(g.array).cast(pa.large_string())
+        _, offsets, dados = textos.buffers()
+        offsets = np.frombuffer(offsets, dtype=np.int64)[textos.offset:textos.offset + len(textos) + 1]
+        dados = np.frombuffer(dados, dtype=np.uint8) if dados is not None else np.empty(0, dtype=np.uint8)
+        novos_dados, novos_offsets = _limpar_ascii_produtos(dados, offsets)
+        limpos = pa.Array.from_buffers(pa.large_string(), len(textos),
+                                       [None, pa.py_buffer(novos_offsets), pa.py_buffer(novos_dados)])
+        limpos = pd.Series(pd.arrays.ArrowExtensionArray(limpos.cast(pa.string())), index=g.index, name=g.name)
+        return limpos.where(g.notna())
+    g = g.str.replace('_', ' ', regex=False)                        # trata underscore como espaço
+    g = g.str.replace(_RE_NON_ALNUM.pattern, '', regex=True)                # remove inválidos
+    g = g.str.replace(_RE_MULTI_SPACE.pattern, ' ', regex=True).str.strip() # remove espaços extras
+    g = g.str.replace(_RE_CAMEL.pattern, r'\1 \2', regex=True)              # separa camelCase
+    g = g.str.replace(_RE_LET_DIG.pattern, r'\1 \2', regex=True)            # separa letra+número
+    g = g.str.replace(_RE_DIG_LET.pattern, r'\1 \2', regex=True)            # separa número+letra
+    g = g.str.replace(_RE_X_PATTERN.pattern, r'\1x\2', regex=True)          # normaliza padrão "x"
+    return g.str.strip()
+
+
+def _limpar_ascii_produtos_py(dados: np.ndarray, offsets: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Equivalente às regras gerais de 'produtos' sobre os buffers de uma coluna de texto
+    (bytes UTF-8 em `dados`; o valor i ocupa dados[offsets[i]:offsets[i + 1]]):
+    - Descarta caracteres fora de [A-Za-z0-9_ ] (inclusive bytes não-ASCII) e trata
+      underscore como espaço.
+    - Colapsa espaços e insere um espaço nas transições minúscula/maiúscula,
+      letra/número e número/letra.
+    - Normaliza o padrão "x" entre números (ex.: 10 x 20 -> 10x20).
+    Retorna os novos buffers de dados e de offsets.
+    """
+    n = offsets.shape[0] - 1
+    total = offsets[n] - offsets[0]
+    tmp = np.empty(2 * total, dtype=np.uint8)   # espaços inseridos no máximo dobram o tamanho
+    out = np.empty(2 * total, dtype=np.uint8)
+    novos_offsets = np.empty(n + 1, dtype=np.int64)
+    novos_offsets[0] = 0
+    m = 0
+    for v in range(n):
+        k = 0
+        anterior = 0        # 1 minúscula, 2 maiúscula, 3 dígito
+        espaco = False      # espaço pendente (só é emitido entre dois caracteres válidos)
+        for i in range(offsets[v], offsets[v + 1]):
+            c = dados[i]
+            if 97 <= c <= 122:
+                classe = 1
+            elif 65 <= c <= 90:
+                classe = 2
+            elif 48 <= c <= 57:
+                classe = 3
+            else:
+                if c == 32 or c == 95:
+                    espaco = True
+                continue
+            if k > 0 and (espaco or (anterior == 1 and classe == 2) or ((anterior == 3) != (classe == 3))):
+                tmp[k] = 32
+                k += 1
+            tmp[k] = c
+            k += 1
+            anterior = classe
+            espaco = False
+
+        i = 0
+        while i < k:
+            c = tmp[i]
+            if 48 <= c <= 57:
+                j = i + 1
+                if j < k and tmp[j] == 32:
+                    j += 1
+                if j < k and (tmp[j] == 120 or tmp[j] == 88):
+                    j += 1
+                    if j < k and tmp[j] == 32:
+                        j += 1
+                    if j < k and 48 <= tmp[j] <= 57:
+                        out[m] = c
+                        out[m + 1] = 120
+                        out[m + 2] = tmp[j]
+                        m += 3
+                        i = j + 1
+                        continue
+            out[m] = c
+            m += 1
+            i += 1
+        novos_offsets[v + 1] = m
+    return out[:m], novos_offsets
+
+
+_limpar_ascii_produtos = njit(cache=True, nogil=True)(_limpar_ascii_produtos_py) if njit is not None else None
+
+
+def _limpar_clientes(serie: pd.Series) -> pd.Series:
+    """Versão vetorizada de `limpar_texto` para colunas de 'clientes'."""
+    texto = _preparar_serie(serie)
+    texto = texto.str.replace(_RE_US_TRIM.pattern, '_', regex=True)        # mantém underscore limpo
+    texto = texto.str.replace(_RE_NON_ALNUM_US.pattern, '', regex=True)   # remove inválidos
+    texto = texto.str.replace(_RE_MULTI_SPACE.pattern, ' ', regex=True).str.strip() # remove espaços extras
+    texto = texto.str.replace(_RE_LET_DIG.pattern, r'\1 \2', regex=True)  # separa letra+número
+    texto = texto.str.replace(_RE_DIG_LET.pattern, r'\1 \2', regex=True)  # separa número+letra
+    texto = texto.str.replace(_RE_US_TRIM.pattern, '_', regex=True)        # limpa espaços em underscores
+    return texto.str.strip()
+
+
 def expandir_coluna_csv_embutido(df: pd.DataFrame) -> pd.DataFrame:
     """
     Expande colunas quando um CSV foi salvo incorretamente em uma única coluna.
@@ -95,24 +353,42 @@ def expandir_coluna_csv_embutido(df: pd.DataFrame) -> pd.DataFrame:
     if df.shape[1] != 1:
         return df
     nome_col = str(df.columns[0])
+    linhas = df.iloc[:, 0].dropna()
+    if not pd.api.types.is_string_dtype(linhas):
+        linhas = linhas.astype('string')
     if ',' in nome_col:
-        cabecalho = [c.strip() for c in nome_col.split(',')]
-        serie = df.iloc[:, 0].astype(str)
-        dados = serie.str.split(',', n=len(cabecalho)-1, expand=True)
-        dados.columns = cabecalho
+        cabecalho = nome_col                              # o cabeçalho está no nome da coluna
+    elif not linhas.empty and ',' in linhas.iloc[0]:
+        cabecalho, linhas = linhas.iloc[0], linhas.iloc[1:]  # o cabeçalho está na primeira linha
+    else:
+        return df
+    nomes = [c.strip() for c in cabecalho.split(',')]
+    try:
+        # O parser em C do pandas separa os campos e respeita aspas e vírgulas entre aspas;
+        # names/index_col=False impedem que um campo a mais vire índice, e o aviso de
+        # campos descartados vira erro para cair na divisão abaixo
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', pd.errors.ParserWarning)
+            dados = pd.read_csv(io.StringIO('\n'.join(linhas)), sep=',', header=None,
+                                names=nomes, index_col=False, dtype=None)
+    except (ValueError, pd.errors.EmptyDataError, pd.errors.ParserWarning):
+        # Linhas com campos a mais, aspas soltas ou nomes repetidos: divide por vírgula
+        # e junta os campos excedentes na última coluna
+        dados = linhas.str.split(',', n=len(nomes) - 1, expand=True)
+        dados = dados.reindex(columns=range(len(nomes)))
+        dados.columns = nomes
         dados.reset_index(drop=True, inplace=True)
-        return dados
-    primeiro = str(df.iloc[0, 0]) if df.shape[0] > 0 else ''
-    if ',' in primeiro:
-        todas = df.iloc[:, 0].astype(str)
-        temp = todas.str.split(',', expand=True)
-        header = temp.iloc[0].tolist()
-        if len(header) > 1:
-            dados = temp.iloc[1:].copy()
-            dados.columns = [h.strip() for h in header]
-            dados.reset_index(drop=True, inplace=True)
-            return dados
-    return df
+    return dados
+
+
+def _formatar_preco(col_num: pd.Series) -> pd.Series:
+    """
+    Arredonda valores numéricos para duas casas e formata como texto ("" para nulos).
+    A formatação é feita de uma vez sobre o array NumPy, sem lambda por elemento.
+    """
+    valores = col_num.round(2).to_numpy(dtype=float, na_value=np.nan)
+    formatados = np.where(np.isnan(valores), '', np.char.mod('%.2f', valores))
+    return pd.Series(formatados, index=col_num.index, name=col_num.name, dtype=object)
 
 
 def tentar_converter_numerico(col: pd.Series, contexto: str, nome_coluna: str) -> pd.Series:
@@ -120,78 +396,416 @@ def tentar_converter_numerico(col: pd.Series, contexto: str, nome_coluna: str) -
     Tenta converter uma coluna textual em valores numéricos.
     Aplica formatação especial para preços em 'produtos'.
     """
+    eh_preco = contexto == "produtos" and nome_coluna.lower() == "preco"
+    if pd.api.types.is_numeric_dtype(col) and not eh_preco:
+        return col  # já numérica: evita uma passada desnecessária
     if not pd.api.types.is_object_dtype(col) and not pd.api.types.is_string_dtype(col):
-        if contexto == "produtos" and nome_coluna.lower() == "preco":
-            col_num = pd.to_numeric(col, errors='coerce').round(2)
-            return col_num.map(lambda x: f"{x:.2f}" if pd.notna(x) else "")
+        if eh_preco:
+            return _formatar_preco(pd.to_numeric(col, errors='coerce'))
         return col
-    nao_nulos = col.dropna().astype(str)
-    if nao_nulos.empty:
+    qtd_nao_nulos = col.notna().sum()
+    if qtd_nao_nulos == 0:
         return col
-    nao_nulos = nao_nulos.str.replace(',', '.', regex=False)
-    padrao_numerico = nao_nulos.str.match(r'^-?\d+(\.\d+)?$')
-    if padrao_numerico.all():
-        col_num = pd.to_numeric(nao_nulos, errors='coerce').reindex(col.index)
-        if contexto == "produtos" and nome_coluna.lower() == "preco":
-            return col_num.round(2).map(lambda x: f"{x:.2f}" if pd.notna(x) else "")
+    texto = col if pd.api.types.is_string_dtype(col) else col.astype('string')
+    texto = texto.str.replace(',', '.', regex=False)
+    # Uma única passada: valores não numéricos viram NaN no to_numeric
+    # (o array NumPy mantém int64/float64 como antes, em vez dos tipos anuláveis)
+    col_num = pd.Series(
+        pd.to_numeric(texto.to_numpy(dtype=object, na_value=np.nan), errors='coerce'),
+        index=col.index, name=col.name,
+    )
+    if col_num.notna().sum() == qtd_nao_nulos:
+        if eh_preco:
+            return _formatar_preco(col_num)
         return col_num
     return col
 
 
-def processar_arquivo(arquivo_entrada: str, arquivo_saida: str) -> None:
+def _corrigir_mojibake_polars(serie: pl.Series) -> pl.Series:
+    """Aplica `corrigir_mojibake` apenas nas linhas suspeitas de uma série Polars."""
+    suspeitos = (serie.str.contains(_RE_MOJIBAKE.pattern) & serie.str.contains(_RE_NAO_ASCII.pattern)).fill_null(False)
+    if not suspeitos.any():
+        return serie
+    valores = serie.to_list()
+    for i in suspeitos.arg_true():
+        valores[i] = corrigir_mojibake(valores[i])
+    return pl.Series(serie.name, valores, dtype=pl.String)
+
+
+def _expr_limpeza_polars(coluna: str, eh_produtos: bool, eh_preco: bool = False) -> pl.Expr:
+    """
+    Expressão Polars equivalente à limpeza vetorizada de uma coluna de texto.
+    As substituições usam a sintaxe de grupos do Rust (${1}) em vez de \\1.
+    """
+    texto = (
+        pl.col(coluna)
+        .map_batches(_corrigir_mojibake_polars, return_dtype=pl.String, is_elementwise=True)
+        .str.normalize('NFKD')
+        .str.replace_all(_PADRAO_MARCAS, '')                      # remove acentuação
+        .str.replace_all(_RE_DEC_COMMA.pattern, '${1}.${2}')      # troca vírgula decimal por ponto
+    )
+    if eh_produtos:
+        if eh_preco:
+            return texto.str.replace_all(_RE_PRECO_CHARS.pattern, '').str.strip_chars()
+        tamanho = (
+            texto.str.replace_all(_RE_NON_ALNUM_US_X.pattern, '')
+            .str.replace_all(_RE_MULTI_SPACE.pattern, ' ').str.strip_chars()
+            .str.replace_all(_RE_X_PATTERN.pattern, '${1}x${2}')
+        )
+        geral = (
+            texto.str.replace('_', ' ', literal=True, n=-1)
+            .str.replace_all(_RE_NON_ALNUM.pattern, '')
+            .str.replace_all(_RE_MULTI_SPACE.pattern, ' ').str.strip_chars()
+            .str.replace_all(_RE_CAMEL.pattern, '${1} ${2}')
+            .str.replace_all(_RE_LET_DIG.pattern, '${1} ${2}')
+            .str.replace_all(_RE_DIG_LET.pattern, '${1} ${2}')
+            .str.replace_all(_RE_X_PATTERN.pattern, '${1}x${2}')
+            .str.strip_chars()
+        )
+        padrao_tamanho = r'\A(?:' + _RE_SIZE_FULL.pattern + r')\z'
+        return pl.when(texto.str.contains(padrao_tamanho)).then(tamanho).otherwise(geral)
+    return (
+        texto.str.replace_all(_RE_US_TRIM.pattern, '_')
+        .str.replace_all(_RE_NON_ALNUM_US.pattern, '')
+        .str.replace_all(_RE_MULTI_SPACE.pattern, ' ').str.strip_chars()
+        .str.replace_all(_RE_LET_DIG.pattern, '${1} ${2}')
+        .str.replace_all(_RE_DIG_LET.pattern, '${1} ${2}')
+        .str.replace_all(_RE_US_TRIM.pattern, '_')
+        .str.strip_chars()
+    )
+
+
+def _processar_csv_polars(arquivo_entrada: str, arquivo_saida: str, contexto: str) -> None:
+    """
+    Processa um CSV com Polars em modo lazy/streaming:
+    - Uma consulta limpa as colunas de texto e identifica as que são numéricas.
+    - Uma segunda consulta converte essas colunas e grava a saída sem carregar o arquivo inteiro.
+    Nulos, tipos e cabeçalho seguem o que o pandas produziria para o mesmo arquivo.
+    """
+    eh_produtos = contexto == "produtos"
+    # Com uma única coluna o arquivo é lido sem marcadores de nulo, para separar as linhas
+    # em branco (descartadas pelo pandas) dos campos "" (nulos no pandas)
+    uma_coluna = len(pl.scan_csv(arquivo_entrada, infer_schema_length=0).collect_schema()) == 1
+    opcoes_leitura = {'infer_schema_length': None}
+    if not uma_coluna:
+        opcoes_leitura['null_values'] = _VALORES_NULOS_PANDAS
+    lf = pl.scan_csv(arquivo_entrada, **opcoes_leitura)
+    esquema = lf.collect_schema()
+    # Inteiros maiores que int64 (ex.: chaves de NF-e) podem não caber em Int128: lê como
+    # Float64, o mesmo tipo que o pandas usa para eles
+    grandes = {c: pl.Float64 for c, tipo in esquema.items() if tipo in (pl.Int128, pl.UInt128)}
+    if grandes:
+        lf = pl.scan_csv(arquivo_entrada, schema_overrides=grandes, **opcoes_leitura)
+        esquema = lf.collect_schema()
+    if uma_coluna:
+        coluna = esquema.names()[0]
+        lf = lf.filter(pl.col(coluna).is_not_null())  # linhas em branco
+        if esquema[coluna] == pl.String:
+            lf = lf.with_columns(
+                pl.when(pl.col(coluna).is_in(_VALORES_NULOS_PANDAS)).then(None).otherwise(pl.col(coluna))
+                .alias(coluna)
+            )
+
+    # As colunas mantêm os nomes lidos (únicos, como o Polars exige); os nomes limpos,
+    # que podem se repetir, só aparecem no cabeçalho gravado
+    cabecalho = [_limpar_cabecalho(c) or c for c in _nomes_colunas_pandas(arquivo_entrada, esquema.names())]
+    # Colunas de preço (apenas em produtos): todas com o nome "preco", sem diferenciar maiúsculas
+    precos = {c for c, limpo in zip(esquema.names(), cabecalho) if eh_produtos and limpo.lower() == "preco"}
+    textuais = [c for c, tipo in esquema.items() if tipo == pl.String]
+    inteiras = [c for c, tipo in esquema.items() if tipo.is_integer() and c not in precos]
+    booleanas = [c for c, tipo in esquema.items() if tipo == pl.Boolean and c not in precos]
+    lf = lf.with_columns([_expr_limpeza_polars(c, eh_produtos, c in precos).alias(c) for c in textuais])
+    # Textos que ficaram vazios na limpeza saem como campo vazio, igual ao pandas
+    lf = lf.with_columns([pl.col(c).replace('', None) for c in textuais])
+    # Booleanos saem como True/False, como no pandas (o Polars gravaria true/false)
+    lf = lf.with_columns([pl.col(c).cast(pl.String).str.to_titlecase() for c in booleanas])
+
+    # Colunas textuais cujos valores não nulos são todos números (ver tentar_converter_numerico)
+    # e colunas inteiras com nulos, que no pandas são float (27.0)
+    if textuais or inteiras:
+        verificacao = lf.select(
+            [(pl.col(c).str.contains(_RE_NUMERIC_STR.pattern).all() & pl.col(c).is_not_null().any()).alias(c)
+             for c in textuais]
+            + [(pl.col(c).str.contains(r'^-?\d+$').all() & pl.col(c).is_not_null().all()).alias(f'{c}__inteiro')
+               for c in textuais]
+            + [pl.col(c).is_null().any().alias(c) for c in inteiras]
+        ).collect(engine='streaming').row(0, named=True)
+        conversoes = [
+            pl.col(c).cast(pl.Int64 if verificacao[f'{c}__inteiro'] else pl.Float64, strict=False)
+            for c in textuais if verificacao[c]
+        ] + [pl.col(c).cast(pl.Float64) for c in inteiras if verificacao[c]]
+        if conversoes:
+            lf = lf.with_columns(conversoes)
+
+    # Formatação final das colunas de preço em produtos
+    if precos:
+        lf = lf.with_columns([
+            pl.col(c).cast(pl.Float64, strict=False).round(2).cast(pl.Decimal(38, 2)).cast(pl.String)
+            for c in precos
+        ])
+    # Com uma única coluna, nulos saem como "" (como no pandas) para não virarem linhas em branco
+    nulo = '""' if uma_coluna else ''
+    with open(arquivo_saida, 'wb') as saida:
+        saida.write(codecs.BOM_UTF8)
+        saida.write(pd.DataFrame(columns=cabecalho).to_csv(index=False, lineterminator='\n').encode('utf-8'))
+        lf.sink_csv(saida, include_header=False, null_value=nulo)
+
+
+def _nomes_colunas_pandas(arquivo_entrada: str, nomes_polars: list[str]) -> list[str]:
+    """
+    Nomes de colunas como o read_csv do pandas os daria (lendo só o cabeçalho): nomes
+    repetidos viram 'x', 'x.1', ... (o Polars usaria 'x_duplicated_0').
+    """
+    nomes = [str(c) for c in pd.read_csv(arquivo_entrada, sep=',', encoding='utf-8', nrows=0).columns]
+    return nomes if len(nomes) == len(nomes_polars) else nomes_polars
+
+
+def _recodificar_para_utf8(arquivo_entrada: str, arquivo_saida: str, encoding: str) -> None:
+    """Copia um arquivo de texto em `encoding` para UTF-8, em blocos, sem carregá-lo inteiro."""
+    with open(arquivo_entrada, encoding=encoding, newline='') as origem, \
+            open(arquivo_saida, 'w', encoding='utf-8', newline='') as destino:
+        shutil.copyfileobj(origem, destino)
+
+
+def _limpar_unicos(col: pd.Series, limpar_coluna) -> pd.Series:
+    """
+    Limpa apenas os valores distintos da coluna e replica o resultado para as demais linhas.
+    Em bases reais marcas, categorias e unidades se repetem muito, então a cadeia de
+    limpeza roda sobre poucos valores; o custo extra é um factorize (hash) da coluna.
+    """
+    codigos, unicos = pd.factorize(col)
+    limpos = limpar_coluna(pd.Series(unicos, name=col.name))
+    valores = pd.api.extensions.take(limpos.array, codigos, allow_fill=True)  # -1 (nulo) vira NA
+    return pd.Series(valores, index=col.index, name=col.name)
+
+
+def _limpar_e_converter_coluna(col: pd.Series, contexto: str, eh_preco: bool) -> pd.Series:
+    """
+    Limpa, converte e formata uma coluna (mesmo nome na saída).
+    `eh_preco` indica uma coluna de preço de 'produtos'.
+    Não depende das demais colunas, por isso pode rodar em paralelo.
+    """
+    coluna = col.name
+    if not eh_preco and pd.api.types.is_numeric_dtype(col):
+        return col  # já numérica: nada a limpar nem converter
+    # Colunas vazias ou só com nulos não têm o que limpar (e o acessor .str não as aceita)
+    if (pd.api.types.is_string_dtype(col) or col.dtype == object) and col.notna().any():
+        if eh_preco:
+            limpar_coluna = _limpar_preco
+        elif contexto == "produtos":
+            limpar_coluna = _limpar_produtos
+        else:
+            limpar_coluna = _limpar_clientes
+        if pd.api.types.is_string_dtype(col):
+            col = _limpar_unicos(col, limpar_coluna)
+        else:
+            col = limpar_coluna(col)  # tipos mistos: 1 e True teriam a mesma chave no factorize
+    if eh_preco:
+        col = _formatar_preco(pd.to_numeric(col, errors='coerce'))
+    else:
+        col = tentar_converter_numerico(col, contexto, nome_coluna=coluna)
+    return col.rename(coluna)
+
+
+def _limpar_df(df: pd.DataFrame, contexto: str) -> pd.DataFrame:
+    """
+    Aplica a limpeza a um DataFrame (arquivo inteiro ou um bloco de um CSV):
+    - Limpa os nomes de colunas.
+    - Limpa, converte e formata as colunas em paralelo (uma thread por coluna).
+    """
+    # Limpeza dos nomes de colunas (mantém o original se a limpeza esvaziar o nome)
+    df.columns = [_limpar_cabecalho(col) or col for col in df.columns]
+    if df.shape[1] == 0:
+        return df
+
+    # Colunas de preço (apenas em produtos): todas com o nome "preco", sem diferenciar maiúsculas
+    precos = [contexto == "produtos" and str(c).lower() == "preco" for c in df.columns]
+
+    # As colunas são independentes; o trabalho pesado ocorre nos kernels do pandas/Arrow/re
+    colunas = [df.iloc[:, i] for i in range(df.shape[1])]
+    max_threads = min(len(colunas), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_threads) as executor:
+        resultados = list(executor.map(
+            lambda col, eh_preco: _limpar_e_converter_coluna(col, contexto, eh_preco), colunas, precos
+        ))
+    limpo = pd.concat(resultados, axis=1)
+    limpo.columns = df.columns
+    return limpo
+
+
+def _gravar_csv(df: pd.DataFrame, saida: BinaryIO, cabecalho: bool = True) -> None:
+    """
+    Grava o DataFrame em UTF-8 em um arquivo binário já aberto (o BOM fica a cargo de quem abre).
+    Usa o escritor em C++ do pyarrow quando a saída dele é idêntica à do pandas (colunas de
+    texto, inteiros e floats, sem valores que precisem de aspas) e o do pandas caso contrário.
+    """
+    tabela = None
+    # Com uma única coluna, o pandas grava "" nas células vazias para não gerar linhas em branco
+    # (que a leitura descartaria); o escritor do pyarrow não faz isso
+    if pa is not None and df.shape[1] > 1:
+        # Floats viram texto antes (ex.: 55.0, 1e-05), como no pandas; o pyarrow escreveria 55
+        flutuantes = [c for c in df.columns if pd.api.types.is_float_dtype(df[c])]
+        if flutuantes:
+            df = df.copy(deep=False)
+            for c in flutuantes:
+                valores = df[c].to_numpy(dtype=float, na_value=np.nan)
+                df[c] = pd.Series(np.where(np.isnan(valores), None, valores.astype(str)),
+                                  index=df.index, dtype=object)
+        try:
+            tabela = pa.Table.from_pandas(df, preserve_index=False)
+        except (ValueError, TypeError):  # nomes duplicados ou tipos mistos
+            tabela = None
+    if tabela is not None and not _escrita_arrow_igual_pandas(tabela):
+        tabela = None
+    if tabela is None:
+        df.to_csv(saida, index=False, sep=',', header=cabecalho, encoding='utf-8', lineterminator='\n')
+        return
+    if cabecalho:  # o cabeçalho do pyarrow sempre vem entre aspas; mantém o formato do pandas
+        saida.write(df.head(0).to_csv(index=False, sep=',', lineterminator='\n').encode('utf-8'))
+    opcoes = pacsv.WriteOptions(include_header=False, delimiter=',', quoting_style='none')
+    pacsv.write_csv(tabela, saida, opcoes)
+
+
+def _escrita_arrow_igual_pandas(tabela: pa.Table) -> bool:
+    """
+    Indica se o pyarrow escreveria a tabela com os mesmos bytes do `to_csv` do pandas.
+    Booleanos (true/false) e datas (com microssegundos) saem diferentes, e com aspas
+    o pyarrow envolveria todos os textos, enquanto o pandas só os campos que precisam.
+    """
+    for coluna in tabela.columns:
+        tipo = coluna.type
+        if pa.types.is_string(tipo) or pa.types.is_large_string(tipo):
+            if pc.any(pc.match_substring_regex(coluna, r'[",\r\n]')).as_py():
+                return False
+        elif not (pa.types.is_integer(tipo) or pa.types.is_null(tipo)):
+            return False
+    return True
+
+
+def _gravar_xlsx(df: pd.DataFrame, arquivo_saida: str) -> None:
+    """
+    Grava o DataFrame em .xlsx com o xlsxwriter em modo `constant_memory`, que envia
+    cada linha ao disco em vez de montar a planilha inteira na memória.
+    As linhas são escritas uma a uma: nesse modo o `to_excel` do pandas, que escreve
+    coluna a coluna, perderia dados.
+    """
+    # O xlsxwriter ignora (sem erro) células fora dos limites do Excel; o pandas recusa a planilha
+    linhas, colunas = df.shape[0] + 1, df.shape[1]  # +1 do cabeçalho
+    if linhas > _MAX_LINHAS_XLSX or colunas > _MAX_COLUNAS_XLSX:
+        raise ValueError(
+            f"Planilha grande demais para .xlsx: {linhas} linhas e {colunas} colunas "
+            f"(máximo {_MAX_LINHAS_XLSX} linhas e {_MAX_COLUNAS_XLSX} colunas). Use saída .csv"
+        )
+    opcoes = {'constant_memory': True, 'strings_to_numbers': False,
+              'default_date_format': 'yyyy-mm-dd hh:mm:ss'}
+    with xlsxwriter.Workbook(arquivo_saida, opcoes) as planilha:
+        aba = planilha.add_worksheet('Sheet1')
+        # Mesmo estilo de cabeçalho do pandas (negrito, borda fina, centralizado)
+        estilo = planilha.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+        aba.write_row(0, 0, [str(c) for c in df.columns], estilo)
+        for i, linha in enumerate(df.itertuples(index=False, name=None), start=1):
+            aba.write_row(i, 0, [_valor_celula(v) for v in linha])
+
+
+def _valor_celula(valor: Any) -> Any:
+    """
+    Converte um valor para escrita no xlsxwriter como o `to_excel` do pandas:
+    nulos viram células vazias e infinitos viram o texto 'inf'/'-inf' (padrão de `inf_rep`).
+    """
+    if pd.isna(valor):
+        return None
+    if isinstance(valor, (float, np.floating)) and np.isinf(valor):
+        return 'inf' if valor > 0 else '-inf'
+    return valor
+
+
+def _processar_csv_em_blocos(arquivo_entrada: str, arquivo_saida: str, contexto: str,
+                             chunksize: int, encoding: str) -> None:
+    """
+    Lê o CSV em blocos de `chunksize` linhas, limpa cada bloco e o acrescenta à saída.
+    O consumo de memória fica limitado ao tamanho do bloco, não ao do arquivo.
+    Atenção: tipos e conversões numéricas são decididos por bloco, então uma mesma coluna
+    pode sair numérica em um bloco e textual em outro (ex.: zeros à esquerda). Por isso
+    o processamento em blocos é opcional e só deve ser usado quando o arquivo não cabe na memória.
+    """
+    # O leitor é aberto antes da saída: um arquivo vazio ou inválido não deixa saída parcial
+    leitor = pd.read_csv(arquivo_entrada, sep=',', encoding=encoding, dtype=None,
+                         chunksize=chunksize)
+    with leitor, open(arquivo_saida, 'wb') as saida:
+        saida.write(codecs.BOM_UTF8)
+        for i, bloco in enumerate(leitor):
+            _gravar_csv(_limpar_df(bloco, contexto), saida, cabecalho=(i == 0))
+
+
+def processar_arquivo(arquivo_entrada: str, arquivo_saida: str, backend: str = "pandas",
+                      chunksize: int | None = None) -> None:
     """
     Processa o arquivo de entrada:
     - Detecta o formato (CSV ou Excel).
     - Aplica a limpeza de dados.
     - Converte colunas numéricas quando aplicável.
     - Salva no formato de saída.
+    Com backend="polars", arquivos CSV -> CSV são processados pelo Polars (lazy/streaming).
+    No backend pandas, um `chunksize` processa CSV -> CSV em blocos desse número de linhas
+    (opcional; ver `_processar_csv_em_blocos`). None ou 0 lê o arquivo inteiro.
     """
     if not os.path.exists(arquivo_entrada):
         raise FileNotFoundError(f"Arquivo '{arquivo_entrada}' não encontrado.")
     ext_in = arquivo_entrada.lower().split('.')[-1]
     ext_out = arquivo_saida.lower().split('.')[-1]
 
-    # Leitura do arquivo de entrada
+    # Define contexto (produtos ou clientes) a partir do nome do arquivo de saída
+    contexto = "produtos" if "produtos" in arquivo_saida.lower() else "clientes"
+
+    if backend not in ("pandas", "polars"):
+        raise ValueError("Backend não suportado. Use 'pandas' ou 'polars'")
+    if backend == "polars" and ext_in == 'csv' and ext_out == 'csv':
+        if pl is None:
+            raise ImportError("O backend 'polars' requer o pacote polars instalado.")
+        try:
+            _processar_csv_polars(arquivo_entrada, arquivo_saida, contexto)
+        except (pl.exceptions.ComputeError, UnicodeDecodeError) as erro:
+            if isinstance(erro, pl.exceptions.ComputeError) and 'utf-8' not in str(erro):
+                raise
+            # O Polars só lê UTF-8: converte uma cópia temporária de latin1, como no pandas
+            with tempfile.TemporaryDirectory() as pasta:
+                convertido = os.path.join(pasta, 'entrada_utf8.csv')
+                _recodificar_para_utf8(arquivo_entrada, convertido, 'latin1')
+                _processar_csv_polars(convertido, arquivo_saida, contexto)
+        return
+    if chunksize and ext_in == 'csv' and ext_out == 'csv':
+        try:
+            _processar_csv_em_blocos(arquivo_entrada, arquivo_saida, contexto, chunksize, 'utf-8')
+        except UnicodeDecodeError:
+            _processar_csv_em_blocos(arquivo_entrada, arquivo_saida, contexto, chunksize, 'latin1')
+        return
+
+    # Leitura do arquivo de entrada com os tipos padrão do pandas: inteiros maiores que
+    # int64 (ex.: chaves de NF-e) não cabem no Arrow, e inteiros com nulos continuam
+    # float ("14.0"). As colunas de texto passam para Arrow na limpeza (`_preparar_serie`).
     if ext_in == 'csv':
         try:
             df = pd.read_csv(arquivo_entrada, sep=',', encoding='utf-8', dtype=None)
         except Exception:
             df = pd.read_csv(arquivo_entrada, sep=',', encoding='latin1', dtype=None)
     elif ext_in in ('xlsx', 'xls'):
-        df = pd.read_excel(arquivo_entrada, dtype=None)
+        try:  # calamine (Rust) é bem mais rápido; sem python-calamine usa o engine padrão
+            df = pd.read_excel(arquivo_entrada, engine='calamine', dtype=None)
+        except (ImportError, ValueError):
+            df = pd.read_excel(arquivo_entrada, dtype=None)
         df = expandir_coluna_csv_embutido(df)
     else:
         raise ValueError("Formato de entrada não suportado. Use .csv ou .xlsx")
 
-    # Define contexto (produtos ou clientes) a partir do nome do arquivo de saída
-    contexto = "produtos" if "produtos" in arquivo_saida.lower() else "clientes"
-
-    # Limpeza dos nomes de colunas
-    novos_nomes = []
-    for col in df.columns:
-        nome_limpo = limpar_texto(col, contexto, nome_coluna=col)
-        novos_nomes.append(nome_limpo if nome_limpo != '' else col)
-    df.columns = novos_nomes
-
-    # Limpeza dos valores textuais
-    for coluna in df.columns:
-        if pd.api.types.is_string_dtype(df[coluna]) or df[coluna].dtype == object:
-            df[coluna] = df[coluna].apply(lambda v: limpar_texto(v, contexto, nome_coluna=coluna))
-
-    # Conversão de colunas numéricas quando possível
-    for coluna in df.columns:
-        df[coluna] = tentar_converter_numerico(df[coluna], contexto, nome_coluna=coluna)
-
-    # Formatação final da coluna de preço em produtos
-    if contexto == "produtos" and "preco" in [c.lower() for c in df.columns]:
-        nome_preco = next(c for c in df.columns if c.lower() == "preco")
-        df[nome_preco] = pd.to_numeric(df[nome_preco], errors='coerce').round(2).map(
-            lambda x: f"{x:.2f}" if pd.notna(x) else ""
-        )
+    df = _limpar_df(df, contexto)
 
     # Exportação do arquivo no formato de saída
     if ext_out == 'csv':
-        df.to_csv(arquivo_saida, index=False, sep=',', encoding='utf-8-sig')
+        with open(arquivo_saida, 'wb') as saida:
+            saida.write(codecs.BOM_UTF8)
+            _gravar_csv(df, saida)
+    elif ext_out == 'xlsx' and xlsxwriter is not None:
+        _gravar_xlsx(df, arquivo_saida)
     elif ext_out in ('xlsx', 'xls'):
         df.to_excel(arquivo_saida, index=False)
     else:
@@ -201,11 +815,16 @@ def processar_arquivo(arquivo_entrada: str, arquivo_saida: str) -> None:
 def main():
     if len(sys.argv) != 3:
         print("Uso: python limpeza_dados.py <arquivo_entrada> <arquivo_saida>")
+        print("     (LIMPEZA_BACKEND=polars usa o Polars para CSV -> CSV)")
+        print(f"     (LIMPEZA_CHUNKSIZE=<linhas> processa CSV em blocos, ex.: {TAMANHO_BLOCO_PADRAO}; "
+              "os tipos passam a ser decididos por bloco)")
         sys.exit(1)
     entrada = sys.argv[1]
     saida = sys.argv[2]
+    backend = os.environ.get("LIMPEZA_BACKEND", "pandas").lower()
     try:
-        processar_arquivo(entrada, saida)
+        chunksize = int(os.environ.get("LIMPEZA_CHUNKSIZE", 0))
+        processar_arquivo(entrada, saida, backend=backend, chunksize=chunksize)
         print(f"✅ Arquivo processado com sucesso: {saida}")
     except Exception as e:
         print(f"❌ Erro: {e}")
@@ -0,0 +1,84 @@
+"""
+Testes de `limpeza_dados`.
+Execução: python -m unittest
+"""
+
+import unicodedata
+import unittest
+
+import pandas as pd
+
+from limpeza_dados import (
+    _limpar_clientes,
+    _limpar_preco,
+    _limpar_produtos,
+    _remover_marcas,
+    limpar_texto,
+    remover_acentos,
+)
+
+
+def remover_acentos_original(texto):
+    """Implementação original, por categoria 'Mn', usada como referência."""
+    texto = unicodedata.normalize('NFKD', texto)
+    return ''.join(ch for ch in texto if unicodedata.category(ch) != 'Mn')
+
+
+class TestRemoverAcentos(unittest.TestCase):
+
+    def test_letras_acentuadas_iguais_a_original(self):
+        texto = 'áéíóúâêôãõàüç ÁÉÍÓÚÂÊÔÃÕÀÜÇ ñÑ ïÏ èÈ'
+        self.assertEqual(remover_acentos(texto), remover_acentos_original(texto))
+        self.assertEqual(remover_acentos(texto), 'aeiouaeoaoauc AEIOUAEOAOAUC nN iI eE')
+
+    def test_simbolos_sem_equivalente_ascii_sao_descartados(self):
+        self.assertEqual(remover_acentos('Caderno_10x20®'), 'Caderno_10x20')
+        self.assertEqual(remover_acentos('9,Ø00'), '9,00')
+        self.assertEqual(remover_acentos('Straße © 2024'), 'Strae  2024')
+
+    def test_compatibilidade_nfkd(self):
+        self.assertEqual(remover_acentos('ﬁ ½ m²'), 'fi 12 m2')
+
+    def test_valores_nao_texto_sao_mantidos(self):
+        self.assertIsNone(remover_acentos(None))
+        self.assertEqual(remover_acentos(12), 12)
+
+    def test_remover_marcas_mantem_simbolos(self):
+        for texto in ('áéíóúâêôãõàüç ÁÉÍ', 'Caderno_10x20®', '9,Ø00', 'Straße © 2024'):
+            self.assertEqual(_remover_marcas(texto), remover_acentos_original(texto))
+
+
+
+class TestLimparTexto(unittest.TestCase):
+
+    VALORES = [
+        'Caneta Azul', 'canetaAzul_10x20', 'Caderno_10x20®', 'Caderno_10 X 20', 'Çapa©10 x 20',
+        'Ação ß_1x2', '  José  da   Silva ', 'Maria _ Souza', 'Rua 10A', 'R$ 9,90', '9,Ø00',
+        '-12,5', 'ConexÃ£o', 'abc123def', '',
+    ]
+
+    def test_valores_de_referencia(self):
+        self.assertEqual(limpar_texto('Caderno_10x20®', 'produtos', 'nome'), 'Caderno 10x20')
+        self.assertEqual(limpar_texto('Caderno_10X20', 'produtos', 'nome'), 'Caderno_10x20')
+        self.assertEqual(limpar_texto('9,Ø00', 'produtos', 'Preco'), '900')
+        self.assertEqual(limpar_texto('canetaAzul10', 'produtos', 'nome'), 'caneta Azul 10')
+        self.assertEqual(limpar_texto('ConexÃ£o _ 10', 'clientes', 'obs'), 'Conexao_10')
+        self.assertTrue(pd.isna(limpar_texto(None, 'produtos', 'preco')))
+
+    def test_versoes_vetorizadas_iguais_a_escalar(self):
+        serie = pd.Series(self.VALORES + [None])
+        casos = [
+            (_limpar_preco, 'produtos', 'preco'),
+            (_limpar_produtos, 'produtos', 'nome'),
+            (_limpar_clientes, 'clientes', 'nome'),
+        ]
+        for funcao, contexto, nome_coluna in casos:
+            with self.subTest(funcao=funcao.__name__):
+                esperado = [limpar_texto(v, contexto, nome_coluna) for v in self.VALORES]
+                obtido = funcao(serie).tolist()
+                self.assertEqual(obtido[:-1], esperado)
+                self.assertTrue(pd.isna(obtido[-1]))
+
+
+if __name__ == '__main__':
+    unittest.main()